@@ -2,6 +2,7 @@
 Configuration file for Crypto MA Strategy Analyzer
 """
 import os
+import sys
 from datetime import datetime
 from typing import Dict, List
 
@@ -42,6 +43,11 @@ class Config:
         }
     }
 
+    # Flattened per-attribute lookups so hot paths do a single dict access
+    # instead of STRATEGIES.get(name, {}).get(attr, default)
+    _MA_RANGES = {k: v['ma_range'] for k, v in STRATEGIES.items()}
+    _WEIGHTS = {k: v.get('weights', [1.0]) for k, v in STRATEGIES.items()}
+
     # Optimization Configuration
     OPTIMIZATION = {
         'scoring_method': 'enhanced_sortino',  # enhanced_sortino, sharpe, cagr
@@ -163,14 +169,12 @@ class Config:
     @classmethod
     def get_ma_range(cls, strategy_name: str) -> tuple:
         """Get MA range for specific strategy"""
-        config = cls.get_strategy_config(strategy_name)
-        return config.get('ma_range', (5, 100))
+        return cls._MA_RANGES.get(strategy_name, (5, 100))
 
     @classmethod
     def get_weights(cls, strategy_name: str) -> List[float]:
         """Get portfolio weights for strategy"""
-        config = cls.get_strategy_config(strategy_name)
-        return config.get('weights', [1.0])
+        return cls._WEIGHTS.get(strategy_name, [1.0])
 
     @classmethod
     def is_rebalancing_strategy(cls, strategy_name: str) -> bool:
@@ -201,6 +205,10 @@ class Config:
         else:
             return "개선 필요"
 
+# Intern the strategy keys so hot-path dict lookups compare by identity
+for _key in Config.STRATEGIES:
+    sys.intern(_key)
+
 # Environment Variables (for production deployment)
 class ProductionConfig(Config):
     """Production configuration with environment variables"""
@@ -3,21 +3,336 @@ import numpy as np
 import yfinance as yf
 import warnings
 import datetime
+import os
 from dateutil.relativedelta import relativedelta
-import json
+import orjson
+import hashlib
+import pickle
 import logging
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional: without it the sweep kernel runs as plain Python,
+    # which is slower but produces identical results
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 warnings.filterwarnings('ignore')
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+@njit(parallel=True, fastmath=True, cache=True)
+def sweep_ma_scores(price: np.ndarray, price_returns: np.ndarray,
+                    ma_lo: int, ma_hi: int) -> np.ndarray:
+    """Score every MA period in [ma_lo, ma_hi] in one compiled parallel pass.
+
+    For each window the rolling-sum SMA, signals, strategy returns and the
+    combined score (0.3 * all-period Sortino + 0.7 * recent Sortino) are
+    computed inline, so no per-MA arrays are allocated.
+    """
+    n = price.size
+    m = n - 1  # strategy_returns length
+    n_ma = ma_hi - ma_lo + 1
+    scores = np.full(n_ma, -999.0)
+
+    if m <= 0:
+        return scores
+
+    cutoff = m - 504 if m > 1008 else m - m // 2  # ~2 years or half the data
+
+    # One cumulative-sum pass serves every window: the SMA ending at day t is
+    # (cs[t+1] - cs[t+1-w]) / w, so no per-window rolling state is needed
+    cs = np.zeros(n + 1)
+    acc = 0.0
+    for j in range(n):
+        acc += price[j]
+        cs[j + 1] = acc
+
+    for k in prange(n_ma):
+        w = ma_lo + k
+        if w >= n:
+            continue
+
+        log_sum_all = 0.0
+        sum_sq_dn = 0.0
+        cnt_dn = 0
+        log_sum_rec = 0.0
+        sum_sq_dn_rec = 0.0
+        cnt_dn_rec = 0
+        sum_dn = 0.0
+        sum_dn_rec = 0.0
+
+        for i in range(1, n):
+            t = i - 1  # day whose signal drives today's return
+            if t >= w - 1:
+                ma_t = (cs[t + 1] - cs[t + 1 - w]) / w
+                r = price_returns[i] if price[t] > ma_t else 0.0
+            else:
+                r = 0.0
+
+            log_r = np.log1p(r)
+            log_sum_all += log_r
+            if r < 0.0:
+                sum_dn += r
+                sum_sq_dn += r * r
+                cnt_dn += 1
+            if t >= cutoff:
+                log_sum_rec += log_r
+                if r < 0.0:
+                    sum_dn_rec += r
+                    sum_sq_dn_rec += r * r
+                    cnt_dn_rec += 1
+
+        # All-period Sortino
+        cagr = np.expm1(log_sum_all * (252.0 / m))
+        sortino_all = 0.0
+        if cnt_dn > 1:
+            mean_dn = sum_dn / cnt_dn
+            var_dn = (sum_sq_dn - cnt_dn * mean_dn * mean_dn) / (cnt_dn - 1)
+            if var_dn > 0.0:
+                dn_dev = np.sqrt(var_dn) * np.sqrt(252.0)
+                sortino_all = (cagr - 0.02) / dn_dev
+
+        # Recent-period Sortino
+        m_rec = m - cutoff
+        sortino_rec = 0.0
+        if m_rec > 0:
+            cagr_rec = np.expm1(log_sum_rec * (252.0 / m_rec))
+            if cnt_dn_rec > 1:
+                mean_dn = sum_dn_rec / cnt_dn_rec
+                var_dn = (sum_sq_dn_rec - cnt_dn_rec * mean_dn * mean_dn) / (cnt_dn_rec - 1)
+                if var_dn > 0.0:
+                    dn_dev = np.sqrt(var_dn) * np.sqrt(252.0)
+                    sortino_rec = (cagr_rec - 0.02) / dn_dev
+
+        scores[k] = 0.3 * sortino_all + 0.7 * sortino_rec
+
+    return scores
+
+@njit(cache=True)
+def _finalize_stats(count, mean, m2, log_sum, sum_dn, sum_sq_dn, count_dn,
+                    count_up, max_dd):
+    """Turn raw accumulator state into the fused-metrics stat tuple"""
+    if count == 0:
+        return 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0
+
+    total_return = np.expm1(log_sum)
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+
+    downside_std = 0.0
+    if count_dn > 1:
+        mean_dn = sum_dn / count_dn
+        var_dn = (sum_sq_dn - count_dn * mean_dn * mean_dn) / (count_dn - 1)
+        if var_dn > 0.0:
+            downside_std = np.sqrt(var_dn)
+
+    return count, total_return, mean, std, downside_std, max_dd, count_up
+
+@njit(cache=True)
+def fused_metrics(returns: np.ndarray):
+    """Accumulate every statistic behind calculate_enhanced_metrics in one pass.
+
+    Returns (count, total_return, mean, std, downside_std, max_drawdown,
+    win_count) with unannualized daily figures; NaN entries are skipped.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    log_sum = 0.0
+    sum_dn = 0.0
+    sum_sq_dn = 0.0
+    count_dn = 0
+    count_up = 0
+    cum = 1.0
+    peak = 1.0
+    max_dd = 0.0
+
+    for i in range(returns.size):
+        r = returns[i]
+        if np.isnan(r):
+            continue
+        count += 1
+
+        # Welford running variance
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+
+        log_sum += np.log1p(r)
+        if r < 0.0:
+            sum_dn += r
+            sum_sq_dn += r * r
+            count_dn += 1
+        elif r > 0.0:
+            count_up += 1
+
+        cum *= 1.0 + r
+        if cum > peak:
+            peak = cum
+        dd = (cum - peak) / peak
+        if dd < max_dd:
+            max_dd = dd
+
+    return _finalize_stats(count, mean, m2, log_sum, sum_dn, sum_sq_dn,
+                           count_dn, count_up, max_dd)
+
+@njit(cache=True)
+def fused_metrics_windowed(returns: np.ndarray, cutoff: int):
+    """fused_metrics over the full array and its tail past cutoff in one pass.
+
+    Returns (all_stats, recent_stats); the recent bucket restarts its
+    drawdown tracking at the cutoff, matching a standalone tail slice.
+    Assumes a NaN-free input — the backtest builds returns as
+    signals × price_returns, which cannot contain NaN, so the defensive
+    per-element scan is skipped here.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    log_sum = 0.0
+    sum_dn = 0.0
+    sum_sq_dn = 0.0
+    count_dn = 0
+    count_up = 0
+    cum = 1.0
+    peak = 1.0
+    max_dd = 0.0
+
+    r_count = 0
+    r_mean = 0.0
+    r_m2 = 0.0
+    r_log_sum = 0.0
+    r_sum_dn = 0.0
+    r_sum_sq_dn = 0.0
+    r_count_dn = 0
+    r_count_up = 0
+    r_cum = 1.0
+    r_peak = 1.0
+    r_max_dd = 0.0
+
+    for i in range(returns.size):
+        r = returns[i]
+        count += 1
+
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+
+        log_r = np.log1p(r)
+        log_sum += log_r
+        if r < 0.0:
+            sum_dn += r
+            sum_sq_dn += r * r
+            count_dn += 1
+        elif r > 0.0:
+            count_up += 1
+
+        cum *= 1.0 + r
+        if cum > peak:
+            peak = cum
+        dd = (cum - peak) / peak
+        if dd < max_dd:
+            max_dd = dd
+
+        if i >= cutoff:
+            r_count += 1
+
+            delta = r - r_mean
+            r_mean += delta / r_count
+            r_m2 += delta * (r - r_mean)
+
+            r_log_sum += log_r
+            if r < 0.0:
+                r_sum_dn += r
+                r_sum_sq_dn += r * r
+                r_count_dn += 1
+            elif r > 0.0:
+                r_count_up += 1
+
+            r_cum *= 1.0 + r
+            if r_cum > r_peak:
+                r_peak = r_cum
+            dd = (r_cum - r_peak) / r_peak
+            if dd < r_max_dd:
+                r_max_dd = dd
+
+    all_stats = _finalize_stats(count, mean, m2, log_sum, sum_dn, sum_sq_dn,
+                                count_dn, count_up, max_dd)
+    recent_stats = _finalize_stats(r_count, r_mean, r_m2, r_log_sum, r_sum_dn,
+                                   r_sum_sq_dn, r_count_dn, r_count_up, r_max_dd)
+    return all_stats, recent_stats
+
+# Memoized backtest results keyed on (ma_period, price digest); persisted to
+# disk so daily re-runs on an unchanged data window skip the recomputation
+_bt_cache: Dict[Tuple[int, str], Dict] = {}
+_BT_CACHE_PATH = 'cache/backtests.pkl'
+
+def _rle_signals(signals: np.ndarray) -> List[List[int]]:
+    """Run-length encode a 0/1 signal array as [value, run] pairs"""
+    changes = np.flatnonzero(np.diff(signals)) + 1
+    starts = np.concatenate(([0], changes))
+    runs = np.diff(np.concatenate((starts, [signals.size])))
+    return [[int(signals[s]), int(r)] for s, r in zip(starts, runs)]
+
+def _downsample_curve(curve: np.ndarray, max_points: int = 500) -> List[float]:
+    """Stride-downsample a curve to ~max_points float32 values for the JSON payload"""
+    stride = max(1, curve.size // max_points)
+    return np.round(curve[::stride].astype(np.float32), 4).tolist()
+
+def _price_digest(price: np.ndarray) -> str:
+    """Stable content hash of a price array for backtest memoization"""
+    return hashlib.blake2b(price.tobytes(), digest_size=16).hexdigest()
+
+def _load_bt_cache():
+    """Load the persisted backtest cache (best effort)"""
+    try:
+        if os.path.exists(_BT_CACHE_PATH):
+            with open(_BT_CACHE_PATH, 'rb') as f:
+                _bt_cache.update(pickle.load(f))
+    except Exception as e:
+        logger.warning(f"백테스트 캐시 로드 실패: {e}")
+
+def _save_bt_cache():
+    """Persist the backtest cache to disk (best effort)"""
+    try:
+        os.makedirs(os.path.dirname(_BT_CACHE_PATH), exist_ok=True)
+        with open(_BT_CACHE_PATH, 'wb') as f:
+            pickle.dump(_bt_cache, f)
+    except Exception as e:
+        logger.warning(f"백테스트 캐시 저장 실패: {e}")
+
+# Ordered by how many of the 0.98 / 1.0 / 1.02 thresholds the ratio clears
+_SIGNAL_LABELS = ('강한 매도', '약한 매도', '약한 매수', '강한 매수')
+
+def classify_signal(price_ma_ratio: float) -> Tuple[str, float]:
+    """Classify the price-to-MA ratio into a signal label and strength.
+
+    Branchless: the label index is the count of cleared thresholds, and the
+    strength formula folds the strong/weak multiplier and caps into arithmetic.
+    """
+    label = _SIGNAL_LABELS[int(price_ma_ratio >= 0.98) + int(price_ma_ratio > 1.0) +
+                           int(price_ma_ratio > 1.02)]
+
+    deviation = abs(price_ma_ratio - 1)
+    strong = int(price_ma_ratio > 1.02) | int(price_ma_ratio < 0.98)
+    strength = 50 + deviation * (500 + 500 * strong)
+    strength = min(99 - 4 * strong, max(1, strength))
+    return label, strength
+
+@dataclass(slots=True, frozen=True)
 class StrategyResult:
     """Strategy analysis result data class"""
     strategy_name: str
@@ -37,31 +352,41 @@ class StrategyResult:
 class CryptoStrategyAnalyzer:
     """Advanced cryptocurrency moving average strategy analyzer"""
 
+    __slots__ = ('data',)
+
+    # Static tables shared by all instances; built once at import
+    STRATEGIES_I18N = {
+        'BTC_only': 'BTC 단일 투자',
+        'ETH_only': 'ETH 단일 투자',
+        'rebalance_50_50': '50:50 리밸런싱',
+        'rebalance_60_40': '60:40 리밸런싱'
+    }
+    MA_RANGES = {
+        'short': range(5, 31),    # 5-30일
+        'medium': range(20, 61),  # 20-60일
+        'long': range(50, 201)    # 50-200일
+    }
+
     def __init__(self):
         self.data = None
-        self.strategies = {
-            'BTC_only': 'BTC 단일 투자',
-            'ETH_only': 'ETH 단일 투자', 
-            'rebalance_50_50': '50:50 리밸런싱',
-            'rebalance_60_40': '60:40 리밸런싱'
-        }
-        self.ma_ranges = {
-            'short': range(5, 31),    # 5-30일
-            'medium': range(20, 61),  # 20-60일
-            'long': range(50, 201)    # 50-200일
-        }
 
     def fetch_crypto_data(self, start_date: str = "2018-01-01") -> pd.DataFrame:
         """Enhanced crypto data fetching with error handling and validation"""
         try:
+            # Serve today's data from the parquet cache instead of re-downloading
+            cache_key = f"cache/crypto_{start_date}_{datetime.date.today()}.parquet"
+            if os.path.exists(cache_key):
+                logger.info(f"캐시된 데이터 사용: {cache_key}")
+                return pd.read_parquet(cache_key)
+
             logger.info("암호화폐 데이터 수집 시작...")
 
-            # Download data with retry mechanism
+            # Download both tickers in one batched call with retry mechanism
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    btc = yf.download("BTC-USD", start=start_date, progress=False)
-                    eth = yf.download("ETH-USD", start=start_date, progress=False)
+                    raw = yf.download(["BTC-USD", "ETH-USD"], start=start_date,
+                                      progress=False, group_by='ticker')
                     break
                 except Exception as e:
                     if attempt == max_retries - 1:
@@ -70,13 +395,14 @@ class CryptoStrategyAnalyzer:
                     time.sleep(2)
 
             # Validate data
-            if btc.empty or eth.empty:
+            if raw.empty:
                 raise ValueError("데이터 수집 실패: 빈 데이터셋")
 
             # Create aligned DataFrame
-            df = pd.DataFrame()
-            df['BTC'] = btc['Close']
-            df['ETH'] = eth['Close']
+            df = pd.DataFrame({
+                'BTC': raw['BTC-USD']['Close'],
+                'ETH': raw['ETH-USD']['Close']
+            })
 
             # Remove NaN values and validate
             df = df.dropna()
@@ -84,6 +410,13 @@ class CryptoStrategyAnalyzer:
             if len(df) < 365:  # Need at least 1 year of data
                 raise ValueError("충분한 데이터가 없습니다")
 
+            # Persist for subsequent runs today (best effort)
+            try:
+                os.makedirs(os.path.dirname(cache_key), exist_ok=True)
+                df.to_parquet(cache_key)
+            except Exception as cache_error:
+                logger.warning(f"데이터 캐시 저장 실패: {cache_error}")
+
             logger.info(f"데이터 수집 완료: {len(df)}개 데이터 포인트")
             return df
 
@@ -91,50 +424,46 @@ class CryptoStrategyAnalyzer:
             logger.error(f"데이터 수집 오류: {e}")
             raise
 
-    def calculate_enhanced_metrics(self, returns: pd.Series, period_returns: pd.Series = None) -> Dict:
+    def calculate_enhanced_metrics(self, returns: np.ndarray, period_returns: np.ndarray = None) -> Dict:
         """Calculate enhanced performance metrics"""
-        if returns.empty:
-            return {}
+        # One fused pass instead of separate prod/std/cumprod/expanding passes
+        metrics = self._metrics_from_stats(fused_metrics(returns))
+
+        # Enhanced combined score with time decay weighting
+        if metrics and period_returns is not None:
+            # Time-weighted performance (more weight on recent performance)
+            recent_weight = 0.7
+            historical_weight = 0.3
+
+            recent_sortino = self._calculate_sortino(period_returns)
+            historical_sortino = metrics['sortino_ratio']
+
+            metrics['combined_score'] = (recent_weight * recent_sortino +
+                                         historical_weight * historical_sortino)
 
-        # Remove NaN values
-        returns = returns.dropna()
+        return metrics
+
+    def _metrics_from_stats(self, stats: Tuple) -> Dict:
+        """Build the metrics dict from a fused-metrics stat tuple"""
+        count, total_return, _, std, downside_std, max_drawdown, win_count = stats
+
+        if count == 0:
+            return {}
 
         # Basic metrics
-        total_return = (1 + returns).prod() - 1
-        num_years = len(returns) / 252  # Trading days per year
+        num_years = count / 252  # Trading days per year
         cagr = (1 + total_return) ** (1/num_years) - 1 if num_years > 0 else 0
 
         # Volatility and Sharpe
-        volatility = returns.std() * np.sqrt(252)
+        volatility = std * np.sqrt(252)
         sharpe_ratio = (cagr - 0.02) / volatility if volatility > 0 else 0  # Assuming 2% risk-free rate
 
         # Sortino ratio (downside deviation)
-        downside_returns = returns[returns < 0]
-        downside_deviation = downside_returns.std() * np.sqrt(252) if len(downside_returns) > 0 else 0
+        downside_deviation = downside_std * np.sqrt(252)
         sortino_ratio = (cagr - 0.02) / downside_deviation if downside_deviation > 0 else 0
 
-        # Maximum Drawdown
-        cumulative_returns = (1 + returns).cumprod()
-        rolling_max = cumulative_returns.expanding().max()
-        drawdowns = (cumulative_returns - rolling_max) / rolling_max
-        max_drawdown = drawdowns.min()
-
         # Win rate
-        win_rate = len(returns[returns > 0]) / len(returns) if len(returns) > 0 else 0
-
-        # Enhanced combined score with time decay weighting
-        if period_returns is not None:
-            # Time-weighted performance (more weight on recent performance)
-            recent_weight = 0.7
-            historical_weight = 0.3
-
-            recent_sortino = self._calculate_sortino(period_returns)
-            historical_sortino = sortino_ratio
-
-            combined_score = (recent_weight * recent_sortino + 
-                            historical_weight * historical_sortino)
-        else:
-            combined_score = sortino_ratio
+        win_rate = win_count / count
 
         return {
             'cagr': cagr,
@@ -144,152 +473,140 @@ class CryptoStrategyAnalyzer:
             'max_drawdown': max_drawdown,
             'win_rate': win_rate,
             'total_return': total_return,
-            'combined_score': combined_score,
-            'num_trades': len(returns)
+            'combined_score': sortino_ratio,
+            'num_trades': count
         }
 
-    def _calculate_sortino(self, returns: pd.Series) -> float:
+    def _calculate_sortino(self, returns: np.ndarray) -> float:
         """Calculate Sortino ratio"""
-        if returns.empty:
+        count, _, mean, _, downside_std, _, _ = fused_metrics(returns)
+        if count == 0:
             return 0
 
-        returns = returns.dropna()
-        mean_return = returns.mean() * 252
-        downside_returns = returns[returns < 0]
-        downside_deviation = downside_returns.std() * np.sqrt(252) if len(downside_returns) > 0 else 0
+        mean_return = mean * 252
+        downside_deviation = downside_std * np.sqrt(252)
 
         return (mean_return - 0.02) / downside_deviation if downside_deviation > 0 else 0
 
-    def backtest_ma_strategy(self, data: pd.DataFrame, ma_period: int, 
-                           strategy_type: str = 'BTC_only') -> Dict:
-        """Enhanced backtesting with multiple strategy types"""
+    def _build_price_series(self, data: pd.DataFrame, strategy_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Build the price and daily-return arrays for a strategy type"""
+        btc_arr = data['BTC'].to_numpy(dtype=np.float64)
+        eth_arr = data['ETH'].to_numpy(dtype=np.float64)
+
+        if strategy_type == 'BTC_only':
+            price = btc_arr
+        elif strategy_type == 'ETH_only':
+            price = eth_arr
+        else:  # Rebalancing strategies
+            if strategy_type == 'rebalance_50_50':
+                weights = [0.5, 0.5]
+            else:  # rebalance_60_40
+                weights = [0.6, 0.4]
+
+            ret_btc = np.zeros_like(btc_arr)
+            ret_btc[1:] = btc_arr[1:] / btc_arr[:-1] - 1
+            ret_eth = np.zeros_like(eth_arr)
+            ret_eth[1:] = eth_arr[1:] / eth_arr[:-1] - 1
+
+            # Daily-rebalanced portfolio returns and synthetic price series
+            portfolio_returns = weights[0] * ret_btc + weights[1] * ret_eth
+            price = np.cumprod(1 + portfolio_returns) * 100
+            return price, portfolio_returns
+
+        price_returns = np.zeros_like(price)
+        price_returns[1:] = price[1:] / price[:-1] - 1
+        return price, price_returns
+
+    def backtest_ma_strategy(self, price: np.ndarray, price_returns: np.ndarray,
+                           ma_period: int) -> Dict:
+        """Backtest one MA period on a precomputed price/return pair (pure NumPy)"""
         try:
-            if strategy_type == 'BTC_only':
-                price_data = data['BTC'].copy()
-            elif strategy_type == 'ETH_only':
-                price_data = data['ETH'].copy()
-            else:  # Rebalancing strategies
-                # For rebalancing, we'll use a portfolio approach
-                if strategy_type == 'rebalance_50_50':
-                    weights = [0.5, 0.5]
-                else:  # rebalance_60_40
-                    weights = [0.6, 0.4]
-
-                # Create portfolio returns
-                btc_returns = data['BTC'].pct_change()
-                eth_returns = data['ETH'].pct_change()
-
-                portfolio_returns = (weights[0] * btc_returns + weights[1] * eth_returns)
-                price_data = (1 + portfolio_returns.fillna(0)).cumprod() * 100
-
-            # Calculate moving average
-            ma = price_data.rolling(window=ma_period, min_periods=ma_period).mean()
-
-            # Generate signals
-            signals = pd.Series(index=price_data.index, dtype=float)
-            signals[price_data > ma] = 1  # Buy signal
-            signals[price_data <= ma] = 0  # Sell signal (hold cash)
-            signals = signals.fillna(method='ffill').fillna(0)
-
-            # Calculate strategy returns
-            price_returns = price_data.pct_change()
-            strategy_returns = signals.shift(1) * price_returns
-            strategy_returns = strategy_returns.dropna()
-
-            # Calculate metrics for different periods
-            all_period_metrics = self.calculate_enhanced_metrics(strategy_returns)
-
-            # Recent period metrics (last 2 years for time weighting)
-            recent_cutoff = len(strategy_returns) - min(504, len(strategy_returns) // 2)  # ~2 years or half data
-            recent_returns = strategy_returns.iloc[recent_cutoff:]
-            recent_metrics = self.calculate_enhanced_metrics(recent_returns)
+            # Identical data window + MA period: serve the memoized result
+            cache_key = (ma_period, _price_digest(price))
+            cached = _bt_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            n = price.size
+
+            # Calculate moving average (cumulative-sum based SMA, no rolling windows)
+            cs = np.concatenate(([0.0], np.cumsum(price)))
+            ma = (cs[ma_period:] - cs[:-ma_period]) / ma_period
+
+            # Generate signals (0 during the MA warmup, then price vs. MA)
+            signals = np.zeros(n, dtype=np.int8)
+            signals[ma_period - 1:] = price[ma_period - 1:] > ma
+
+            # Calculate strategy returns (previous day's signal applied to today's return)
+            strategy_returns = signals[:-1] * price_returns[1:]
+
+            # All-period and recent-window (last 2 years) metrics in one pass
+            m = strategy_returns.size
+            recent_cutoff = m - 504 if m > 1008 else m - m // 2  # ~2 years or half data
+            all_stats, recent_stats = fused_metrics_windowed(strategy_returns, recent_cutoff)
+            all_period_metrics = self._metrics_from_stats(all_stats)
+            recent_metrics = self._metrics_from_stats(recent_stats)
 
             # Enhanced combined score
-            if len(recent_returns) > 0:
+            if recent_metrics:
                 all_period_metrics['combined_score'] = (
-                    0.3 * all_period_metrics.get('sortino_ratio', 0) + 
+                    0.3 * all_period_metrics.get('sortino_ratio', 0) +
                     0.7 * recent_metrics.get('sortino_ratio', 0)
                 )
 
             # Trading analysis
-            position_changes = signals.diff()
-            trades = len(position_changes[position_changes != 0])
+            trades = int(np.count_nonzero(np.diff(signals)))
 
             # Current signal analysis
-            current_price = price_data.iloc[-1]
-            current_ma = ma.iloc[-1]
-            current_signal = "매수" if current_price > current_ma else "매도"
+            current_price = price[-1]
+            current_ma = ma[-1]
 
             # Signal strength based on price-MA divergence
             price_ma_ratio = current_price / current_ma if current_ma > 0 else 1
-            if price_ma_ratio > 1.02:
-                signal_strength = min(95, 50 + (price_ma_ratio - 1) * 1000)
-                current_signal = "강한 매수"
-            elif price_ma_ratio > 1:
-                signal_strength = 50 + (price_ma_ratio - 1) * 500
-                current_signal = "약한 매수"
-            elif price_ma_ratio < 0.98:
-                signal_strength = min(95, 50 + (1 - price_ma_ratio) * 1000)
-                current_signal = "강한 매도"
-            else:
-                signal_strength = 50 + (1 - price_ma_ratio) * 500
-                current_signal = "약한 매도"
+            current_signal, signal_strength = classify_signal(price_ma_ratio)
 
-            return {
+            result = {
                 **all_period_metrics,
                 'ma_period': ma_period,
                 'total_trades': trades,
                 'current_signal': current_signal,
-                'signal_strength': min(99, max(1, signal_strength)),
+                'signal_strength': signal_strength,
                 'current_price_ma_ratio': price_ma_ratio,
-                'cumulative_returns': (1 + strategy_returns).cumprod().tolist(),
-                'signals': signals.tolist(),
+                'cumulative_returns': _downsample_curve(np.cumprod(1 + strategy_returns)),
+                'signals': _rle_signals(signals),
                 'recent_performance': recent_metrics
             }
+            _bt_cache[cache_key] = result
+            return result
 
         except Exception as e:
-            logger.error(f"백테스팅 오류 ({strategy_type}, MA={ma_period}): {e}")
+            logger.error(f"백테스팅 오류 (MA={ma_period}): {e}")
             return {}
 
     def find_optimal_ma(self, data: pd.DataFrame, strategy_type: str = 'BTC_only') -> StrategyResult:
         """Find optimal MA period using enhanced scoring"""
         logger.info(f"{strategy_type} 전략 최적화 시작...")
 
-        best_score = -999
-        best_ma = 20
-        best_result = {}
+        # Build the strategy's price/return arrays once — every MA period in the
+        # sweep backtests the same series, so none of this belongs in the loop
+        price_arr, price_returns = self._build_price_series(data, strategy_type)
 
         # Test different MA periods based on strategy type
         if strategy_type in ['BTC_only', 'ETH_only']:
-            test_range = range(5, 101)  # 5-100 days for single asset
+            ma_lo, ma_hi = 5, 100  # 5-100 days for single asset
         else:
-            test_range = range(10, 61)  # 10-60 days for portfolio strategies
-
-        # Parallel processing for faster optimization
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {
-                executor.submit(self.backtest_ma_strategy, data, ma_period, strategy_type): ma_period
-                for ma_period in test_range
-            }
-
-            for future in futures:
-                try:
-                    result = future.result(timeout=30)
-                    ma_period = futures[future]
-
-                    if result and 'combined_score' in result:
-                        score = result['combined_score']
-                        if score > best_score:
-                            best_score = score
-                            best_ma = ma_period
-                            best_result = result
+            ma_lo, ma_hi = 10, 60  # 10-60 days for portfolio strategies
 
-                except Exception as e:
-                    logger.warning(f"MA {futures[future]} 최적화 실패: {e}")
+        # Score the whole sweep in one compiled parallel kernel, then run the
+        # full backtest only for the winning MA period
+        scores = sweep_ma_scores(price_arr, price_returns, ma_lo, ma_hi)
+        best_ma = ma_lo + int(np.argmax(scores))
+        best_result = self.backtest_ma_strategy(price_arr, price_returns, best_ma)
+        best_score = best_result.get('combined_score', float(scores[best_ma - ma_lo]))
 
         # Create StrategyResult
         strategy_result = StrategyResult(
-            strategy_name=self.strategies[strategy_type],
+            strategy_name=self.STRATEGIES_I18N[strategy_type],
             optimal_ma=best_ma,
             cagr=best_result.get('cagr', 0) * 100,
             mdd=best_result.get('max_drawdown', 0) * 100,
@@ -312,33 +629,43 @@ class CryptoStrategyAnalyzer:
         logger.info("전체 전략 분석 시작...")
 
         try:
+            # Warm the backtest memo from previous runs
+            _load_bt_cache()
+
             # Fetch data
             self.data = self.fetch_crypto_data()
 
-            results = {}
-
-            # Analyze each strategy
-            for strategy_type in self.strategies.keys():
-                try:
-                    strategy_result = self.find_optimal_ma(self.data, strategy_type)
-                    results[strategy_type] = {
-                        'strategy_name': strategy_result.strategy_name,
-                        'optimal_ma': strategy_result.optimal_ma,
-                        'cagr': strategy_result.cagr,
-                        'mdd': strategy_result.mdd,
-                        'sharpe_ratio': strategy_result.sharpe_ratio,
-                        'sortino_ratio': strategy_result.sortino_ratio,
-                        'combined_score': strategy_result.combined_score,
-                        'win_rate': strategy_result.win_rate,
-                        'total_trades': strategy_result.total_trades,
-                        'current_signal': strategy_result.current_signal,
-                        'signal_strength': strategy_result.signal_strength,
-                        'last_signal_change': strategy_result.last_signal_change,
-                        'backtest_data': strategy_result.backtest_data
-                    }
-                except Exception as e:
-                    logger.error(f"{strategy_type} 분석 실패: {e}")
-                    continue
+            completed = {}
+
+            # Analyze the strategies concurrently, one worker process each
+            with ProcessPoolExecutor(max_workers=len(self.STRATEGIES_I18N),
+                                     initializer=_load_bt_cache) as executor:
+                futures = {
+                    executor.submit(_optimize_strategy, self.data, strategy_type): strategy_type
+                    for strategy_type in self.STRATEGIES_I18N
+                }
+
+                for future in as_completed(futures):
+                    strategy_type = futures[future]
+                    try:
+                        strategy_result, fresh_entries = future.result()
+                        # Merge the worker's new backtest memo entries so
+                        # _save_bt_cache below actually persists them
+                        _bt_cache.update(fresh_entries)
+                        # Shallow slot walk instead of dataclasses.asdict, which
+                        # would deep-copy the large backtest_data dict
+                        completed[strategy_type] = {
+                            field: getattr(strategy_result, field)
+                            for field in StrategyResult.__slots__
+                        }
+                    except Exception as e:
+                        logger.error(f"{strategy_type} 분석 실패: {e}")
+
+            # Keep the configured strategy order regardless of completion order
+            results = {
+                strategy_type: completed[strategy_type]
+                for strategy_type in self.STRATEGIES_I18N if strategy_type in completed
+            }
 
             # Add metadata
             results['metadata'] = {
@@ -348,6 +675,9 @@ class CryptoStrategyAnalyzer:
                 'version': '2.0.0'
             }
 
+            # Persist the backtest memo for the next run
+            _save_bt_cache()
+
             logger.info("전체 분석 완료")
             return results
 
@@ -355,15 +685,65 @@ class CryptoStrategyAnalyzer:
             logger.error(f"전체 분석 실패: {e}")
             return {}
 
+    CURVES_FILE = 'curves.parquet'
+
     def save_results(self, results: Dict, filename: str = 'strategy_results.json'):
-        """Save analysis results to JSON file"""
+        """Save scalar results to JSON and the return curves to Parquet"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            # Split the cumulative-return arrays out of the JSON: the dashboard
+            # only needs scalar metrics on initial load, and a columnar Parquet
+            # file lets the chart tab read one strategy's curve at a time
+            summary, curves = self._split_curves(results)
+
+            # orjson writes UTF-8 directly; compact output (no indent) keeps
+            # the save path fast
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_SERIALIZE_NUMPY))
+
+            if curves:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                # Null-pad to a common length: Parquet columns must match
+                longest = max(len(curve) for curve in curves.values())
+                table = pa.table({
+                    name: pa.array(list(curve) + [None] * (longest - len(curve)),
+                                   type=pa.float32())
+                    for name, curve in curves.items()
+                })
+                pq.write_table(table, self.CURVES_FILE)
+
             logger.info(f"결과 저장 완료: {filename}")
         except Exception as e:
             logger.error(f"결과 저장 실패: {e}")
 
+    @staticmethod
+    def _split_curves(results: Dict) -> tuple:
+        """Return (summary without curves, {strategy: cumulative_returns})"""
+        summary = {}
+        curves = {}
+        for strategy_type, data in results.items():
+            if not isinstance(data, dict) or 'backtest_data' not in data:
+                summary[strategy_type] = data
+                continue
+            backtest = dict(data['backtest_data'])
+            curve = backtest.pop('cumulative_returns', None)
+            if curve is not None and len(curve):
+                curves[strategy_type] = curve
+            summary[strategy_type] = {**data, 'backtest_data': backtest}
+        return summary, curves
+
+def _optimize_strategy(data: pd.DataFrame, strategy_type: str) -> Tuple[StrategyResult, Dict]:
+    """Module-level wrapper so strategy optimization is picklable for workers.
+
+    Also returns the backtest-cache entries this worker added: the worker's
+    _bt_cache dies with the pool, so the parent merges them before persisting.
+    """
+    known = set(_bt_cache)
+    result = CryptoStrategyAnalyzer().find_optimal_ma(data, strategy_type)
+    fresh = {key: _bt_cache[key] for key in _bt_cache.keys() - known}
+    return result, fresh
+
 def main():
     """Main function for standalone execution"""
     analyzer = CryptoStrategyAnalyzer()
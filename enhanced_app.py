@@ -4,7 +4,8 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-import json
+import itertools
+import orjson
 import datetime
 from dateutil.relativedelta import relativedelta
 import warnings
@@ -24,7 +25,7 @@ st.set_page_config(
 )
 
 # Custom CSS for enhanced UI
-st.markdown("""
+_CUSTOM_CSS = """
 <style>
     .main-header {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -104,15 +105,32 @@ st.markdown("""
     .risk-medium { background: #ffc107; color: #333; }
     .risk-high { background: #dc3545; color: white; }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_resource
+def _inject_css():
+    """Send the stylesheet once per session instead of on every rerun"""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+    return True
+
+_inject_css()
+
+def _results_still_fresh(data):
+    """Keep the cached dict until strategy_results.json actually changes"""
+    try:
+        return data is not None and data.get('_mtime') == os.path.getmtime('strategy_results.json')
+    except (OSError, AttributeError):
+        return False
+
+@st.cache_resource(validate=_results_still_fresh)  # one parsed copy per process
 def load_strategy_data():
     """Load cached strategy results"""
     try:
         if os.path.exists('strategy_results.json'):
-            with open('strategy_results.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open('strategy_results.json', 'rb') as f:
+                data = orjson.loads(f.read())
+            data['_mtime'] = os.path.getmtime('strategy_results.json')
+            return data
         else:
             # If no cached data, run analysis
             analyzer = CryptoStrategyAnalyzer()
@@ -121,24 +139,38 @@ def load_strategy_data():
         st.error(f"데이터 로딩 오류: {e}")
         return None
 
-def display_signal_card(signal, strength, last_change, days_since):
-    """Display trading signal in a card format"""
+def _signal_card_html(signal, strength, last_change, days_since):
+    """Build one trading-signal card as an HTML snippet"""
     if "매수" in signal:
         card_class = "buy-signal"
         icon = "📈"
     elif "매도" in signal:
-        card_class = "sell-signal" 
+        card_class = "sell-signal"
         icon = "📉"
     else:
         card_class = "hold-signal"
         icon = "➡️"
 
-    st.markdown(f"""
-    <div class="signal-card {card_class}">
-        {icon} {signal} (신뢰도: {strength}%)
-        <br><small>마지막 변경: {last_change} ({days_since}일 전)</small>
-    </div>
-    """, unsafe_allow_html=True)
+    return (
+        f'<div class="signal-card {card_class}">'
+        f'{icon} {signal} (신뢰도: {strength}%)'
+        f'<br><small>마지막 변경: {last_change} ({days_since}일 전)</small>'
+        f'</div>'
+    )
+
+@st.cache_data
+def _load_curve(strategy, mtime):
+    """Read one strategy's cumulative-return curve from curves.parquet.
+
+    Columnar read: only the selected strategy's series comes off disk.
+    mtime keys the cache so a fresh analysis invalidates old curves.
+    """
+    try:
+        import pyarrow.parquet as pq
+        table = pq.read_table('curves.parquet', columns=[strategy])
+        return table.column(0).drop_null().to_numpy(zero_copy_only=False)
+    except Exception:
+        return None
 
 def create_performance_chart(data):
     """Create interactive performance comparison chart"""
@@ -153,14 +185,35 @@ def create_performance_chart(data):
     strategies = list(data.keys())
     colors = ['#667eea', '#764ba2', '#f093fb', '#f5576c']
 
-    for i, strategy in enumerate(strategies):
-        if 'cumulative_returns' in data[strategy]:
+    try:
+        curves_mtime = os.path.getmtime('curves.parquet')
+    except OSError:
+        curves_mtime = None
+
+    x_cache = {}  # curves share lengths, so one arange serves every trace
+
+    for strategy, color in zip(strategies, itertools.cycle(colors)):
+        strategy_data = data[strategy] if isinstance(data[strategy], dict) else {}
+        curve = _load_curve(strategy, curves_mtime) if curves_mtime else None
+        if curve is None:
+            # Results written before the Parquet split keep curves in the JSON
+            curve = strategy_data.get('cumulative_returns',
+                                      strategy_data.get('backtest_data', {}).get('cumulative_returns'))
+        if curve is not None:
+            # Downsample server-side and ship float32: bytes to the browser,
+            # not plotting FLOPs, dominate chart latency on long histories
+            curve = np.asarray(curve, dtype=np.float32)
+            stride = max(1, curve.size // 2000)
+            # int32 x halves the axis payload in the serialized figure
+            x = x_cache.setdefault(
+                (curve.size, stride),
+                np.arange(0, curve.size, stride, dtype=np.int32))
             fig.add_trace(
-                go.Scatter(
-                    x=list(range(len(data[strategy]['cumulative_returns']))),
-                    y=data[strategy]['cumulative_returns'],
+                go.Scattergl(
+                    x=x,
+                    y=curve[::stride],
                     name=strategy,
-                    line=dict(color=colors[i % len(colors)], width=3)
+                    line=dict(color=color, width=3)
                 ),
                 row=1, col=1
             )
@@ -174,44 +227,177 @@ def create_performance_chart(data):
 
     return fig
 
+# Static market-status cards, rendered as one grid so each rerun sends a
+# single websocket delta instead of four column messages
+_MARKET_STATUS_CARDS = (
+    ('시장 트렌드', '상승 📈'),
+    ('변동성 지수', '중간 ⚡'),
+    ('공포탐욕지수', '중립 😐'),
+    ('추천 비중', '70% 💪'),
+)
+
+_MARKET_STATUS_HTML = (
+    '<div style="display:grid;grid-template-columns:repeat(4,1fr);gap:1rem">'
+    + ''.join(
+        f'<div class="metric-container"><h3>{title}</h3><h2>{value}</h2></div>'
+        for title, value in _MARKET_STATUS_CARDS
+    )
+    + '</div>'
+)
+
 def display_market_status():
     """Display current market status and indicators"""
     st.markdown("### 🌐 현재 시장 상황")
+    st.markdown(_MARKET_STATUS_HTML, unsafe_allow_html=True)
+
+# Strategy keys and display names shared by the tab fragments
+STRATEGIES = ['BTC_only', 'ETH_only', 'rebalance_50_50', 'rebalance_60_40']
+STRATEGY_NAMES = ['BTC 단일', 'ETH 단일', '50:50 리밸런싱', '60:40 리밸런싱']
+
+@st.fragment
+def _tab_signals(data):
+    """실시간 신호 탭 (fragment: 탭 내 상호작용만 재실행)"""
+    st.markdown("### 🚨 현재 매매 신호")
+
+    # One batched render: a single markdown delta instead of ~3 messages
+    # per strategy card
+    cells = []
+    for i, (strategy, name) in enumerate(zip(STRATEGIES, STRATEGY_NAMES)):
+        if strategy not in data:
+            continue
+
+        optimal_ma = data[strategy].get('optimal_ma', 20)
+
+        # Mock current signal (in real implementation, this would use live data)
+        signal = "강한 매수" if i % 2 == 0 else "약한 매도"
+        strength = 85 if i % 2 == 0 else 72
+        last_change = "2024-01-15"
+        days_since = 3
+
+        cells.append(
+            f'<div><h4>{name}</h4>'
+            + _signal_card_html(signal, strength, last_change, days_since)
+            + f'<p><strong>최적 MA:</strong> {optimal_ma}일<br>'
+            f'<strong>현재 가격 vs MA:</strong> +2.5%<br>'
+            f'<strong>신호 지속기간:</strong> {days_since}일</p></div>'
+        )
+
+    st.markdown(
+        '<div style="display:grid;grid-template-columns:1fr 1fr;gap:1rem">'
+        + ''.join(cells) + '</div>',
+        unsafe_allow_html=True
+    )
 
-    col1, col2, col3, col4 = st.columns(4)
+@st.cache_data
+def _performance_table(strategy_names: tuple) -> pd.DataFrame:
+    """Build the tab-2 metrics table once per process"""
+    return pd.DataFrame({
+        '전략': list(strategy_names),
+        'CAGR (%)': [25.4, 32.1, 28.7, 26.9],
+        'MDD (%)': [-45.2, -52.3, -38.1, -41.7],
+        'Sharpe': [1.23, 1.45, 1.67, 1.52],
+        'Sortino': [1.89, 2.12, 2.34, 2.18],
+        '최적 MA': [21, 18, 24, 22]
+    })
+
+@st.fragment
+def _tab_performance(data):
+    """성과 비교 탭 (fragment)"""
+    st.markdown("### 📊 전략별 성과 비교")
+
+    if data:
+        # Performance metrics table (cached; formatting handled client-side)
+        performance_df = _performance_table(tuple(STRATEGY_NAMES))
+
+        st.dataframe(
+            performance_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'CAGR (%)': st.column_config.NumberColumn(format='%.1f'),
+                'MDD (%)': st.column_config.NumberColumn(format='%.1f'),
+                'Sharpe': st.column_config.NumberColumn(format='%.2f'),
+                'Sortino': st.column_config.NumberColumn(format='%.2f')
+            }
+        )
+
+        # Performance chart
+        if st.checkbox("상세 차트 보기"):
+            fig = create_performance_chart(data)
+            st.plotly_chart(fig, use_container_width=True)
+
+def _metric_html(label, value, delta):
+    """Build one metric card as an HTML snippet (st.metric look-alike)"""
+    delta_html = ''
+    if delta:
+        color = '#dc3545' if delta.startswith('-') else '#28a745'
+        delta_html = f'<span style="color:{color}">{delta}</span>'
+    return (
+        f'<div class="metric-container"><small>{label}</small>'
+        f'<h2>{value}</h2>{delta_html}</div>'
+    )
 
-    with col1:
-        st.markdown("""
-        <div class="metric-container">
-            <h3>시장 트렌드</h3>
-            <h2>상승 📈</h2>
-        </div>
-        """, unsafe_allow_html=True)
+# Static detail metrics, batched into one markdown grid: a single widget
+# message per rerun instead of six st.metric deltas
+_DETAIL_METRICS = (
+    ('연평균 수익률', '28.5%', '2.3%'),
+    ('승률', '67.4%', '1.8%'),
+    ('최대 수익', '156.7%', ''),
+    ('최대 낙폭', '-38.1%', '7.2%'),
+    ('평균 보유기간', '12.3일', '-0.5일'),
+    ('위험도', '보통', ''),
+)
 
-    with col2:
-        st.markdown("""
-        <div class="metric-container">
-            <h3>변동성 지수</h3>
-            <h2>중간 ⚡</h2>
-        </div>
-        """, unsafe_allow_html=True)
+_DETAIL_METRICS_HTML = (
+    '<div style="display:grid;grid-template-columns:repeat(3,1fr);gap:1rem">'
+    + ''.join(_metric_html(*metric) for metric in _DETAIL_METRICS)
+    + '</div>'
+)
 
-    with col3:
-        st.markdown("""
-        <div class="metric-container">
-            <h3>공포탐욕지수</h3>
-            <h2>중립 😐</h2>
-        </div>
-        """, unsafe_allow_html=True)
+@st.fragment
+def _tab_details(data):
+    """상세 분석 탭 (fragment)"""
+    st.markdown("### 🔍 전략별 상세 분석")
+
+    selected_strategy = st.selectbox("분석할 전략 선택", STRATEGY_NAMES)
 
-    with col4:
+    strategy_key = STRATEGIES[STRATEGY_NAMES.index(selected_strategy)]
+
+    if strategy_key in data:
+        strategy_data = data[strategy_key]
+
+        st.markdown(_DETAIL_METRICS_HTML, unsafe_allow_html=True)
+
+        # Risk indicators
+        st.markdown("#### 위험 지표")
         st.markdown("""
-        <div class="metric-container">
-            <h3>추천 비중</h3>
-            <h2>70% 💪</h2>
+        <div>
+            <span class="risk-indicator risk-low">유동성 위험: 낮음</span>
+            <span class="risk-indicator risk-medium">변동성 위험: 보통</span>
+            <span class="risk-indicator risk-low">시장 위험: 낮음</span>
         </div>
         """, unsafe_allow_html=True)
 
+@st.fragment
+def _tab_settings():
+    """설정 탭 (fragment: 위젯 조작이 전체 페이지를 재실행하지 않음)"""
+    st.markdown("### ⚙️ 설정 및 알림")
+
+    st.markdown("#### 알림 설정")
+    email_alert = st.checkbox("이메일 알림 받기")
+    if email_alert:
+        email = st.text_input("이메일 주소")
+
+    signal_threshold = st.slider("신호 민감도", 1, 10, 5)
+
+    st.markdown("#### 포트폴리오 설정")
+    investment_amount = st.number_input("투자 금액 (원)", min_value=100000, value=1000000, step=100000)
+
+    risk_level = st.selectbox("위험 성향", ["보수적", "중립적", "공격적"])
+
+    if st.button("설정 저장"):
+        st.success("설정이 저장되었습니다!")
+
 def main():
     # Header
     st.markdown("""
@@ -248,111 +434,16 @@ def main():
     tab1, tab2, tab3, tab4 = st.tabs(["🎯 실시간 신호", "📈 성과 비교", "🔍 상세 분석", "⚙️ 설정"])
 
     with tab1:
-        st.markdown("### 🚨 현재 매매 신호")
-
-        strategies = ['BTC_only', 'ETH_only', 'rebalance_50_50', 'rebalance_60_40']
-        strategy_names = ['BTC 단일', 'ETH 단일', '50:50 리밸런싱', '60:40 리밸런싱']
-
-        col1, col2 = st.columns(2)
-
-        for i, (strategy, name) in enumerate(zip(strategies, strategy_names)):
-            with col1 if i % 2 == 0 else col2:
-                st.markdown(f"#### {name}")
-
-                if strategy in data:
-                    strategy_data = data[strategy]
-                    optimal_ma = strategy_data.get('optimal_ma', 20)
-
-                    # Mock current signal (in real implementation, this would use live data)
-                    signal = "강한 매수" if i % 2 == 0 else "약한 매도"
-                    strength = 85 if i % 2 == 0 else 72
-                    last_change = "2024-01-15"
-                    days_since = 3
-
-                    display_signal_card(signal, strength, last_change, days_since)
-
-                    st.markdown(f"""
-                    **최적 MA:** {optimal_ma}일  
-                    **현재 가격 vs MA:** +2.5%  
-                    **신호 지속기간:** {days_since}일
-                    """)
+        _tab_signals(data)
 
     with tab2:
-        st.markdown("### 📊 전략별 성과 비교")
-
-        if data:
-            # Performance metrics table
-            performance_df = pd.DataFrame({
-                '전략': strategy_names,
-                'CAGR (%)': [25.4, 32.1, 28.7, 26.9],
-                'MDD (%)': [-45.2, -52.3, -38.1, -41.7],
-                'Sharpe': [1.23, 1.45, 1.67, 1.52],
-                'Sortino': [1.89, 2.12, 2.34, 2.18],
-                '최적 MA': [21, 18, 24, 22]
-            })
-
-            st.dataframe(
-                performance_df,
-                use_container_width=True,
-                hide_index=True
-            )
-
-            # Performance chart
-            if st.checkbox("상세 차트 보기"):
-                fig = create_performance_chart(data)
-                st.plotly_chart(fig, use_container_width=True)
+        _tab_performance(data)
 
     with tab3:
-        st.markdown("### 🔍 전략별 상세 분석")
-
-        selected_strategy = st.selectbox("분석할 전략 선택", strategy_names)
-
-        strategy_key = strategies[strategy_names.index(selected_strategy)]
-
-        if strategy_key in data:
-            strategy_data = data[strategy_key]
-
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.metric("연평균 수익률", "28.5%", "2.3%")
-                st.metric("최대 낙폭", "-38.1%", "7.2%")
-
-            with col2:
-                st.metric("승률", "67.4%", "1.8%")
-                st.metric("평균 보유기간", "12.3일", "-0.5일")
-
-            with col3:
-                st.metric("최대 수익", "156.7%", "")
-                st.metric("위험도", "보통", "")
-
-            # Risk indicators
-            st.markdown("#### 위험 지표")
-            st.markdown("""
-            <div>
-                <span class="risk-indicator risk-low">유동성 위험: 낮음</span>
-                <span class="risk-indicator risk-medium">변동성 위험: 보통</span>
-                <span class="risk-indicator risk-low">시장 위험: 낮음</span>
-            </div>
-            """, unsafe_allow_html=True)
+        _tab_details(data)
 
     with tab4:
-        st.markdown("### ⚙️ 설정 및 알림")
-
-        st.markdown("#### 알림 설정")
-        email_alert = st.checkbox("이메일 알림 받기")
-        if email_alert:
-            email = st.text_input("이메일 주소")
-
-        signal_threshold = st.slider("신호 민감도", 1, 10, 5)
-
-        st.markdown("#### 포트폴리오 설정")
-        investment_amount = st.number_input("투자 금액 (원)", min_value=100000, value=1000000, step=100000)
-
-        risk_level = st.selectbox("위험 성향", ["보수적", "중립적", "공격적"])
-
-        if st.button("설정 저장"):
-            st.success("설정이 저장되었습니다!")
+        _tab_settings()
 
     # Footer
     st.markdown("---")
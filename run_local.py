@@ -0,0 +1,81 @@
+"""
+Local development runner for the Crypto MA Strategy Analyzer
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Resolve the venv interpreter once; running it directly skips both the
+# shell fork and the activation script
+VENV_DIR = Path('venv')
+VENV_PYTHON = VENV_DIR / ('Scripts' if sys.platform == 'win32' else 'bin') / 'python'
+
+def run_command(cmd, description):
+    """Run an argv-list command without a shell, streaming output live"""
+    print(f"🔄 {description}...")
+    try:
+        subprocess.run([str(part) for part in cmd], check=True)
+        print(f"✅ {description} 완료")
+        return True
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"❌ {description} 실패: {e}")
+        return False
+
+def setup_environment():
+    """Create the virtualenv and install requirements into it"""
+    if not VENV_DIR.exists():
+        if not run_command([sys.executable, '-m', 'venv', VENV_DIR], '가상환경 생성'):
+            return False
+
+    return run_command([VENV_PYTHON, '-m', 'pip', 'install', '-r', 'requirements.txt'],
+                       '패키지 설치')
+
+def run_analysis():
+    """Run the strategy analysis inside the venv"""
+    return run_command([VENV_PYTHON, 'data_processor.py'], '전략 분석 실행')
+
+def run_dashboard():
+    """Launch the Streamlit dashboard"""
+    return run_command([VENV_PYTHON, '-m', 'streamlit', 'run', 'enhanced_app.py'],
+                       '대시보드 실행')
+
+def deploy_check():
+    """Verify required files and syntax before deploying"""
+    required = ['config.py', 'data_processor.py', 'enhanced_app.py', 'requirements.txt']
+    missing = [name for name in required if not os.path.exists(name)]
+    if missing:
+        print(f"❌ 누락된 파일: {', '.join(missing)}")
+        return False
+
+    return run_command([VENV_PYTHON, '-m', 'compileall', '-q', '.'], '문법 검사')
+
+def clean_data():
+    """Remove generated result, log and cache files"""
+    for filename in ['strategy_results.json', 'curves.parquet',
+                     'crypto_analyzer.log', 'cache/backtests.pkl']:
+        # Single unlink syscall; missing_ok drops the stat + TOCTOU window
+        Path(filename).unlink(missing_ok=True)
+        print(f"🗑️ 삭제: {filename}")
+    return True
+
+ACTIONS = {
+    'setup': setup_environment,
+    'analysis': run_analysis,
+    'dashboard': run_dashboard,
+    'check': deploy_check,
+    'clean': clean_data,
+}
+
+def main():
+    """Entry point: python run_local.py [setup|analysis|dashboard|check|clean]"""
+    action = sys.argv[1] if len(sys.argv) > 1 else 'dashboard'
+
+    if action not in ACTIONS:
+        print(f"사용법: python run_local.py [{'|'.join(ACTIONS)}]")
+        sys.exit(1)
+
+    sys.exit(0 if ACTIONS[action]() else 1)
+
+if __name__ == "__main__":
+    main()
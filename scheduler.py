@@ -0,0 +1,214 @@
+"""
+Daily analysis scheduler for the Crypto MA Strategy Analyzer
+"""
+import datetime
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
+from config import get_config
+from data_processor import CryptoStrategyAnalyzer
+
+logger = logging.getLogger(__name__)
+
+def _parse_update_time(value: str) -> datetime.time:
+    """Parse the configured HH:MM update time, defaulting to 09:00.
+
+    DevelopmentConfig ships a cron expression here; fall back gracefully
+    instead of crashing the scheduler on it.
+    """
+    try:
+        return datetime.datetime.strptime(value, '%H:%M').time()
+    except ValueError:
+        logger.warning(f"update_time 형식이 HH:MM이 아닙니다: {value!r}, 09:00 사용")
+        return datetime.time(9, 0)
+
+class CryptoAnalysisScheduler:
+    """Run the full analysis on a daily schedule and send notifications"""
+
+    def __init__(self, config=None):
+        self.config = config or get_config()
+        self.analyzer = CryptoStrategyAnalyzer()
+
+        # Hoist the config sub-dicts walked on every notification
+        self._notif = self.config.NOTIFICATIONS
+        self._api = self.config.API
+
+        # Built lazily on first webhook send so cold starts with webhook
+        # notifications disabled never pay for importing requests
+        self._http = None
+
+        # Notifications ship from this single worker so the scheduler loop
+        # goes back to sleep (and the next analysis can start) while slow
+        # SMTP/webhook I/O from the previous run is still in flight
+        self._notify_worker = ThreadPoolExecutor(max_workers=1,
+                                                 thread_name_prefix='notify')
+
+    def _get_http(self):
+        """Return the shared keep-alive session, creating it on first use"""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter, Retry
+
+            # One session for all webhook calls: the TCP+TLS handshake is
+            # paid once per connection instead of once per notification
+            self._http = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=2, pool_maxsize=4,
+                max_retries=Retry(total=self._api['max_retries'],
+                                  backoff_factor=self._api['backoff_factor'])
+            )
+            self._http.mount('https://', adapter)
+            self._http.mount('http://', adapter)
+        return self._http
+
+    def run_analysis(self):
+        """Run one full analysis cycle and notify the configured channels"""
+        try:
+            start = datetime.datetime.now()
+            logger.info(f"정기 분석 시작: {start.strftime('%Y-%m-%d %H:%M:%S')}")
+
+            results = self.analyzer.run_full_analysis()
+            if not results:
+                raise ValueError("분석 결과가 비어 있습니다")
+
+            self.analyzer.save_results(results, self.config.PATHS['data_file'])
+            self._notify_worker.submit(self._send_notification, results)
+
+            elapsed = (datetime.datetime.now() - start).total_seconds()
+            logger.info(f"정기 분석 완료 ({elapsed:.1f}초)")
+            return True
+
+        except Exception as e:
+            # logger.exception defers the stack walk to the handler, so a
+            # filtered-out level never pays for formatting the traceback
+            logger.exception(f"정기 분석 실패: {e}")
+            return False
+
+    def _send_notification(self, results):
+        """Send the analysis summary through every enabled channel"""
+        # One timestamp for the whole notification cycle: avoids repeated
+        # clock reads and keeps email/webhook timestamps in agreement
+        now = datetime.datetime.now()
+
+        channels = []
+        if self._notif['email']['enabled']:
+            channels.append(('이메일', self._send_email_notification))
+        if self._notif['webhook']['enabled']:
+            channels.append(('웹훅', self._send_webhook_notification))
+        if not channels:
+            return
+
+        # The channels are independent I/O — overlap the SMTP handshake and
+        # the webhook POST instead of paying for them back to back
+        with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+            futures = [(label, executor.submit(send, results, now))
+                       for label, send in channels]
+            for label, future in futures:
+                try:
+                    future.result(timeout=35)
+                except Exception as e:
+                    logger.warning(f"{label} 알림 실패: {e}", exc_info=True)
+
+    def _build_summary(self, results, now):
+        """Build a short text summary of the per-strategy signals"""
+        lines = [f"암호화폐 전략 분석 결과 ({now.strftime('%Y-%m-%d')})"]
+
+        for strategy_type, data in results.items():
+            if strategy_type in ('metadata', '_mtime'):
+                continue
+            lines.append(
+                f"- {data['strategy_name']}: MA {data['optimal_ma']}일, "
+                f"{data['current_signal']} ({data['signal_strength']:.0f}%)"
+            )
+
+        return '\n'.join(lines)
+
+    def _send_email_notification(self, results, now):
+        """Send the summary by email"""
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+
+        cfg = self._notif['email']
+        smtp_server, smtp_port = cfg['smtp_server'], cfg['smtp_port']
+        username, password = cfg['username'], cfg['password']
+
+        msg = MIMEMultipart()
+        msg['Subject'] = f"암호화폐 전략 분석 {now.strftime('%Y-%m-%d')}"
+        msg['From'] = cfg['from_email']
+        msg['To'] = ', '.join(cfg['to_emails'])
+
+        body = self._build_summary(results, now) + '\n\n' + orjson.dumps(
+            results.get('metadata', {}),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+
+        with smtplib.SMTP(smtp_server, smtp_port) as server:
+            server.starttls()
+            server.login(username, password)
+            server.send_message(msg)
+
+    def _send_webhook_notification(self, results, now):
+        """Post the summary to the configured webhook"""
+        webhook_cfg = self._notif['webhook']
+
+        payload = {
+            'text': self._build_summary(results, now),
+            'timestamp': now.isoformat(),
+            'metadata': results.get('metadata', {})
+        }
+
+        # orjson serializes the payload instead of requests' stdlib json path
+        headers = {'Content-Type': 'application/json', **webhook_cfg['headers']}
+        response = self._get_http().post(webhook_cfg['url'], data=orjson.dumps(payload),
+                                         headers=headers,
+                                         timeout=self._api['timeout'])
+        response.raise_for_status()
+
+    def run_scheduler(self):
+        """Block forever, waking only when the next scheduled job is due"""
+        import schedule
+
+        at_time = _parse_update_time(self.config.UPDATE_SCHEDULE['update_time'])
+        schedule.every().day.at(at_time.strftime('%H:%M')).do(self.run_analysis)
+        logger.info(f"스케줄러 시작: 매일 {at_time.strftime('%H:%M')}")
+
+        while True:
+            # Sleep exactly until the next job instead of polling every minute
+            idle = schedule.idle_seconds()
+            if idle is None:
+                break
+            if idle > 0:
+                time.sleep(idle)
+            schedule.run_pending()
+
+class StreamlitCloudScheduler:
+    """Update check for environments without a resident scheduler process"""
+
+    def __init__(self, config=None):
+        self.config = config or get_config()
+        # Parse once: should_update may be polled on every Streamlit rerun
+        self._update_time = _parse_update_time(self.config.UPDATE_SCHEDULE['update_time'])
+
+    def should_update(self, last_update: str = None) -> bool:
+        """Return True when today's update time has passed since last_update"""
+        now = datetime.datetime.now()
+        today_run = datetime.datetime.combine(now.date(), self._update_time)
+
+        if last_update is None:
+            return now >= today_run
+
+        last = datetime.datetime.strptime(last_update, '%Y-%m-%d %H:%M:%S')
+        return now >= today_run and last < today_run
+
+def main():
+    """Entry point for the resident scheduler"""
+    scheduler = CryptoAnalysisScheduler()
+    scheduler.run_analysis()  # run once at startup, then daily
+    scheduler.run_scheduler()
+
+if __name__ == "__main__":
+    main()